@@ -1,11 +1,16 @@
-import json
-import time
+import asyncio
 import signal
 import logging
 from typing import Optional
-from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Load environment variables once at process start
+load_dotenv()
 
 from src.api.kraken_client import KrakenClient
+from src.api.kraken_ws_client import KrakenWSClient
+from src.config import load_config
 from src.trading.indicators import Indicator
 from src.trading.strategy import LimitStrategy
 
@@ -16,66 +21,78 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global flag for shutdown
-running = True
-
-def load_config() -> dict:
-    """Load trading configuration from JSON file."""
-    config_path = Path("config/trading_config.json")
-    try:
-        with open(config_path) as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Failed to load config: {e}")
-        raise
-
-def handle_shutdown(strategy: Optional[LimitStrategy] = None) -> None:
+def handle_shutdown(strategy: Optional[LimitStrategy] = None,
+                    ws_client: Optional[KrakenWSClient] = None) -> None:
     """Handle graceful shutdown of the bot."""
-    global running
-    running = False
     logger.info("Shutting down bot...")
-    if strategy and not strategy.test_mode and strategy.active_order:
-        try:
-            strategy.client.cancel_order(strategy.active_order)
-            logger.info("Cancelled open orders")
-        except Exception as e:
-            logger.error(f"Error cancelling orders during shutdown: {e}")
+    if ws_client:
+        ws_client.stop()
+    if strategy:
+        if not strategy.test_mode and strategy.active_order:
+            try:
+                strategy.client.cancel_order(strategy.active_order)
+                logger.info("Cancelled open orders")
+            except Exception as e:
+                logger.error("Error cancelling orders during shutdown: %s", e)
+        strategy.close()
 
-def main() -> None:
+async def main() -> None:
     """Main execution function."""
     strategy = None
-    
+    ws_client = None
+
     try:
         # Load configuration
         config = load_config()
-        
+
         # Initialize components
         client = KrakenClient()
         indicator = Indicator(client)
         strategy = LimitStrategy(config, client, indicator, test_mode=True)
-        
-        # Setup shutdown handler
-        signal.signal(signal.SIGINT, lambda s, f: handle_shutdown(strategy))
-        signal.signal(signal.SIGTERM, lambda s, f: handle_shutdown(strategy))
-        
-        # Main trading loop
-        logger.info("Starting trading bot...")
-        while running:
+
+        def on_candle(close: float) -> None:
+            """Run one strategy iteration when a candle closes."""
+            logger.info("Candle closed at %s", close)
             try:
+                indicator.update_close(config.pair, 60, config.sma_length, close)
                 strategy.execute()
-                time.sleep(config['check_interval'])
             except Exception as e:
-                logger.error(f"Error during execution: {e}")
-                time.sleep(60)  # Wait before retry
-                
+                logger.error("Error during execution: %s", e)
+
+        ws_client = KrakenWSClient(
+            pair=config.pair,
+            interval=60,
+            window_length=config.sma_length,
+            on_candle=on_candle
+        )
+
+        # Seed the rolling close window with one REST fetch so the SMA
+        # is meaningful before the first streamed candle closes; the last
+        # element is the still-forming candle, so it stays out
+        ws_client.seed(client.get_ohlc_closes(config.pair, interval=60)[:-1])
+
+        # Setup shutdown handler
+        signal.signal(signal.SIGINT, lambda s, f: handle_shutdown(strategy, ws_client))
+        signal.signal(signal.SIGTERM, lambda s, f: handle_shutdown(strategy, ws_client))
+
+        logger.info("Starting trading bot...")
+
+        # Initial iteration, then candle-close events drive the strategy
+        try:
+            strategy.execute()
+        except Exception as e:
+            logger.error("Error during execution: %s", e)
+
+        await ws_client.run()
+
         logger.info("Trading bot stopped")
-                
+
     except KeyboardInterrupt:
         logger.info("Received shutdown signal")
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
     finally:
-        handle_shutdown(strategy)
+        handle_shutdown(strategy, ws_client)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
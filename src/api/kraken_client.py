@@ -1,19 +1,22 @@
 import os
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, Tuple
 from krakenex import API
 from pykrakenapi import KrakenAPI
-from dotenv import load_dotenv
 import logging
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Load environment variables from .env file
-load_dotenv()
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("kraken_client")
 
 
 class KrakenClient:
+    # Ticker responses stay valid long enough to serve calls made within
+    # the same tick; OHLC responses stay valid for the candle duration
+    TICKER_TTL = 1.0
+
     def __init__(self, api: Optional[API] = None):
         """
         Initialize the KrakenClient with API credentials from environment variables or an existing API instance.
@@ -29,8 +32,38 @@ class KrakenClient:
         
         self.api = api
         self.kraken = KrakenAPI(api)
+
+        # Process-local response caches keyed by request parameters
+        self._ticker_cache: Dict[str, Tuple[float, Any]] = {}
+        self._ohlc_cache: Dict[Tuple[str, int, Optional[int]], Tuple[float, Any]] = {}
+
+        # Reuse one pooled keep-alive session for every request instead of
+        # paying a fresh TCP+TLS handshake per call
+        self._session = self._build_session()
+        if getattr(self.api, 'session', None) is not None:
+            # Keep the User-Agent krakenex sets on its own session
+            self._session.headers.update(self.api.session.headers)
+        self.api.session = self._session
         logger.info("Kraken client initialized")
 
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """
+        Build a pooled HTTP session with keep-alive and retries.
+
+        Returns:
+            requests.Session: Session shared by all Kraken API calls.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=40,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        session.mount('https://', adapter)
+        session.headers.update({'Connection': 'keep-alive'})
+        return session
+
     def test_connection(self) -> bool:
         """
         Test API connection and key validity.
@@ -48,7 +81,7 @@ class KrakenClient:
             logger.info("API connection test successful")
             return True
         except Exception as e:
-            logger.error(f"API connection test failed: {str(e)}")
+            logger.error("API connection test failed: %s", e)
             return False
 
     def get_account_balance(self) -> Dict[str, float]:
@@ -66,7 +99,28 @@ class KrakenClient:
             logger.info("Account balance retrieved successfully")
             return balance
         except Exception as e:
-            logger.error(f"Error getting account balance: {str(e)}")
+            logger.error("Error getting account balance: %s", e)
+            raise
+
+    def get_currency_balance(self, currency: str) -> float:
+        """
+        Get the balance of a single currency without building the full map.
+
+        Args:
+            currency (str): Currency code as used by Kraken (e.g., "ZUSD").
+
+        Returns:
+            float: Available balance, 0.0 if the currency is not held.
+        """
+        try:
+            balance = self.kraken.get_account_balance()
+            if isinstance(balance, pd.DataFrame):
+                if currency not in balance.index:
+                    return 0.0
+                return float(balance.loc[currency].iloc[0])
+            return float(balance.get(currency, 0.0))
+        except Exception as e:
+            logger.error("Error getting %s balance: %s", currency, e)
             raise
 
     def get_ticker_info(self, pair: str) -> pd.DataFrame:
@@ -85,19 +139,26 @@ class KrakenClient:
         try:
             if not isinstance(pair, str) or len(pair) < 3:
                 raise ValueError(f"Invalid trading pair format: {pair}")
-                
-            response = self.api.query_public('Ticker', {'pair': pair})
-            if 'error' in response and response['error']:
-                raise ValueError(f"Kraken API error: {response['error'][0]}")
-                
+
+            cached = self._ticker_cache.get(pair)
+            if cached is not None and time.monotonic() - cached[0] < self.TICKER_TTL:
+                return cached[1]
+
+            # Single round trip; Kraken errors surface through the raised
+            # exception rather than a separate validation query
             ticker = self.kraken.get_ticker_information(pair)
-            logger.info(f"Ticker info retrieved for {pair}")
+            self._ticker_cache[pair] = (time.monotonic(), ticker)
+            logger.info("Ticker info retrieved for %s", pair)
             return ticker
+        except ValueError:
+            raise
         except Exception as e:
             error_msg = str(e)
             if 'EQuery:Unknown asset pair' in error_msg:
                 raise ValueError(f"Unknown trading pair: {pair}")
-            logger.error(f"Error getting ticker info: {error_msg}")
+            if 'EGeneral:Invalid arguments' in error_msg:
+                raise ValueError(f"Kraken API error: {error_msg}")
+            logger.error("Error getting ticker info: %s", error_msg)
             raise
         
     def get_historical_data(self, pair: str, interval: int = 60, since: Optional[int] = None) -> pd.DataFrame:
@@ -113,11 +174,58 @@ class KrakenClient:
             pd.DataFrame: Historical OHLC data.
         """
         try:
+            # Entries are stamped with the candle bucket they were fetched
+            # in, so a new candle always invalidates regardless of when
+            # within the old candle the fetch happened
+            cache_key = (pair, interval, since)
+            bucket = int(time.time()) // (interval * 60)
+            cached = self._ohlc_cache.get(cache_key)
+            if cached is not None and cached[0] == bucket:
+                return cached[1]
+
             ohlc, _ = self.kraken.get_ohlc_data(pair, interval=interval, since=since)
-            logger.info(f"Historical data retrieved for {pair}")
+            if isinstance(ohlc, pd.DataFrame):
+                # Kraken returns prices as strings; convert once here so
+                # consumers don't repeat per-cell coercion on every use
+                numeric_cols = {col: 'float64'
+                                for col in ('open', 'high', 'low', 'close', 'vwap', 'volume')
+                                if col in ohlc.columns}
+                if numeric_cols:
+                    ohlc = ohlc.astype(numeric_cols, copy=False)
+            self._ohlc_cache[cache_key] = (bucket, ohlc)
+            logger.info("Historical data retrieved for %s", pair)
             return ohlc
         except Exception as e:
-            logger.error(f"Error getting historical data for {pair}: {str(e)}")
+            logger.error("Error getting historical data for %s: %s", pair, e)
+            raise
+
+    def get_ohlc_closes(self, pair: str, interval: int = 60) -> list:
+        """
+        Get closing prices for a pair straight from the REST response.
+
+        Skips the pykrakenapi/pandas layer entirely: the krakenex query goes
+        out over the pooled session and the close column is lifted from the
+        raw candle lists, which is all the indicator hot path needs.
+
+        Args:
+            pair (str): The currency pair (e.g., "XBTUSD").
+            interval (int): Timeframe interval in minutes. Default is 60 (1 hour).
+
+        Returns:
+            list: Closing prices as floats, oldest candle first.
+        """
+        try:
+            response = self.api.query_public('OHLC', {'pair': pair, 'interval': interval})
+            if response.get('error'):
+                raise ValueError(f"Kraken API error: {response['error'][0]}")
+
+            # The result holds one candle list per pair plus a 'last' cursor
+            candles = next(v for k, v in response['result'].items() if k != 'last')
+            closes = [float(candle[4]) for candle in candles]
+            logger.info("Fetched %s closes for %s", len(closes), pair)
+            return closes
+        except Exception as e:
+            logger.error("Error getting OHLC closes for %s: %s", pair, e)
             raise
 
     def place_limit_order(self, pair: str, volume: float, price: float, side: str = "buy", validate: bool = True) -> Dict[str, Any]:
@@ -144,12 +252,12 @@ class KrakenClient:
                 validate=validate
             )
             if validate:
-                logger.info(f"Validated limit order: {order}")
+                logger.info("Validated limit order: %s", order)
             else:
-                logger.info(f"Limit order placed: {order}")
+                logger.info("Limit order placed: %s", order)
             return order
         except Exception as e:
-            logger.error(f"Error placing limit order for {pair}: {str(e)}")
+            logger.error("Error placing limit order for %s: %s", pair, e)
             raise
 
     def cancel_order(self, order_id: str) -> None:
@@ -162,11 +270,11 @@ class KrakenClient:
         try:
             response = self.api.query_private('CancelOrder', {'txid': order_id})
             if response.get("error"):
-                logger.error(f"Error canceling order {order_id}: {response['error']}")
+                logger.error("Error canceling order %s: %s", order_id, response['error'])
                 raise Exception(response['error'])
-            logger.info(f"Order {order_id} canceled successfully.")
+            logger.info("Order %s canceled successfully.", order_id)
         except Exception as e:
-            logger.error(f"Error canceling order {order_id}: {str(e)}")
+            logger.error("Error canceling order %s: %s", order_id, e)
             raise
 
     def get_open_orders(self) -> Dict[str, Any]:
@@ -181,7 +289,7 @@ class KrakenClient:
             logger.info("Open orders retrieved successfully.")
             return open_orders
         except Exception as e:
-            logger.error(f"Error retrieving open orders: {str(e)}")
+            logger.error("Error retrieving open orders: %s", e)
             raise
 
     def get_trade_history(self) -> Dict[str, Any]:
@@ -196,7 +304,7 @@ class KrakenClient:
             logger.info("Trade history retrieved successfully.")
             return trades
         except Exception as e:
-            logger.error(f"Error retrieving trade history: {str(e)}")
+            logger.error("Error retrieving trade history: %s", e)
             raise
 
     def get_order_details(self, txid: str) -> Dict[str, Any]:
@@ -211,10 +319,10 @@ class KrakenClient:
         """
         try:
             order_details = self.kraken.query_orders_info(txid=txid)
-            logger.info(f"Order details retrieved for transaction ID {txid}.")
+            logger.info("Order details retrieved for transaction ID %s.", txid)
             return order_details
         except Exception as e:
-            logger.error(f"Error retrieving order details for transaction ID {txid}: {str(e)}")
+            logger.error("Error retrieving order details for transaction ID %s: %s", txid, e)
             raise
 
     def update_limit_order(self, pair: str, volume: float, new_price: float, order_id: str, side: str) -> None:
@@ -234,7 +342,7 @@ class KrakenClient:
 
             # Place a new order with updated details
             self.place_limit_order(pair=pair, volume=volume, price=new_price, side=side, validate=False)
-            logger.info(f"Order updated for {pair} to new price {new_price}")
+            logger.info("Order updated for %s to new price %s", pair, new_price)
         except Exception as e:
-            logger.error(f"Error updating limit order for {pair}: {str(e)}")
+            logger.error("Error updating limit order for %s: %s", pair, e)
             raise
\ No newline at end of file
@@ -1,5 +1,6 @@
 import os
-import requests
+import orjson
+import httpx
 from typing import Dict, Any, Optional
 import logging
 
@@ -9,7 +10,7 @@ class KrakenFuturesClient:
     def __init__(self, demo: bool = True):
         """
         Initialize Futures API client
-        
+
         Args:
             demo (bool): If True, uses demo API endpoint
         """
@@ -18,10 +19,17 @@ class KrakenFuturesClient:
         self.api_key = os.getenv('KRAKEN_FUTURES_KEY')
         self.api_secret = os.getenv('KRAKEN_FUTURES_SECRET')
 
+        # One keep-alive HTTP/2 client: TLS is amortized across calls and
+        # concurrent requests multiplex on a single connection
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            http2=True,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+
     def place_limit_order(self, symbol: str, side: str, price: float, size: float) -> Dict[str, Any]:
         """Place a limit order on futures market"""
-        endpoint = f"{self.base_url}/api/v3/sendorder"
-        
         payload = {
             "orderType": "lmt",
             "symbol": symbol,
@@ -29,14 +37,23 @@ class KrakenFuturesClient:
             "size": size,
             "limitPrice": price,
         }
-        
+
         # Add authentication headers here
-        
-        response = requests.post(endpoint, json=payload)
-        return response.json()
+
+        response = self._client.post("/api/v3/sendorder", json=payload)
+        return orjson.loads(response.content)
 
     def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """Get ticker information"""
-        endpoint = f"{self.base_url}/api/v3/tickers"
-        response = requests.get(endpoint)
-        return response.json()
\ No newline at end of file
+        response = self._client.get("/api/v3/tickers")
+        return orjson.loads(response.content)
+
+    def close(self) -> None:
+        """Release the pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> "KrakenFuturesClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
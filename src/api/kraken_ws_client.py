@@ -0,0 +1,204 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Callable, Optional
+
+import websockets
+
+logger = logging.getLogger("kraken_ws_client")
+
+
+class KrakenWSClient:
+    """
+    Streaming market data client for Kraken's public WebSocket API.
+
+    Subscribes to the `ohlc` channel for a single trading pair and keeps a
+    rolling window of closing prices. Instead of polling REST endpoints on a
+    timer, callers register an `on_candle` callback which fires once per
+    closed candle.
+    """
+
+    WS_URL = "wss://ws.kraken.com"
+    RECONNECT_BASE_DELAY = 1.0
+    RECONNECT_MAX_DELAY = 60.0
+
+    # REST pair names whose wsname cannot be derived mechanically
+    _WS_PAIR_OVERRIDES = {
+        "XXBTZUSD": "XBT/USD",
+        "XXBTZEUR": "XBT/EUR",
+        "XETHZUSD": "ETH/USD",
+        "XETHZEUR": "ETH/EUR",
+    }
+
+    def __init__(
+        self,
+        pair: str,
+        interval: int = 60,
+        window_length: Optional[int] = None,
+        on_candle: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        """
+        Initialize the WebSocket client.
+
+        Args:
+            pair (str): The trading pair to subscribe to (e.g., "XBT/USD").
+            interval (int): Candle interval in minutes. Default is 60 (1 hour).
+            window_length (Optional[int]): Size of the rolling close window
+                (e.g., the SMA length). Unbounded if None.
+            on_candle (Optional[Callable]): Callback invoked with the closing
+                price each time a candle finishes.
+        """
+        self.pair = self.to_ws_pair(pair)
+        self.interval = interval
+        self.closes: deque = deque(maxlen=window_length)
+        self.on_candle = on_candle
+        self.running = False
+        self._current_candle_end: Optional[float] = None
+        self._current_close: Optional[float] = None
+
+    @classmethod
+    def to_ws_pair(cls, pair: str) -> str:
+        """
+        Translate a REST pair name into the wsname the WebSocket API expects.
+
+        The WebSocket API rejects REST-style names like "XXBTZUSD"; it only
+        accepts wsname format ("XBT/USD"). Pairs already containing a slash
+        pass through unchanged.
+
+        Args:
+            pair (str): REST pair name or wsname.
+
+        Returns:
+            str: The wsname to subscribe with.
+        """
+        if "/" in pair:
+            return pair
+        if pair in cls._WS_PAIR_OVERRIDES:
+            return cls._WS_PAIR_OVERRIDES[pair]
+        # Classified REST names pair a 4-char X-prefixed base with a 4-char
+        # Z-prefixed quote (e.g. XLTCZUSD -> LTC/USD)
+        if len(pair) == 8 and pair[0] in "XZ" and pair[4] in "XZ":
+            return f"{pair[1:4]}/{pair[5:8]}"
+        return pair
+
+    @property
+    def sma(self) -> Optional[float]:
+        """
+        Simple moving average over the rolling close window.
+
+        Returns:
+            Optional[float]: The average of the buffered closes, or None if
+            no candle has been recorded yet.
+        """
+        if not self.closes:
+            return None
+        return sum(self.closes) / len(self.closes)
+
+    def seed(self, closes) -> None:
+        """
+        Pre-fill the rolling window from a historical fetch.
+
+        Args:
+            closes: Iterable of closing prices, oldest first.
+        """
+        for close in closes:
+            self.closes.append(float(close))
+        logger.info("Seeded close window with %s candles", len(self.closes))
+
+    def _subscribe_message(self) -> str:
+        """Build the JSON subscription message for the ohlc channel."""
+        return json.dumps({
+            "event": "subscribe",
+            "pair": [self.pair],
+            "subscription": {"name": "ohlc", "interval": self.interval},
+        })
+
+    def handle_message(self, raw: str) -> Optional[float]:
+        """
+        Parse one WebSocket message and detect candle closes.
+
+        Kraken publishes ohlc updates as
+        `[channel_id, [time, etime, open, high, low, close, ...], "ohlc-N", pair]`
+        and re-sends the current candle on every trade. A candle is considered
+        closed when an update arrives with a later end-time than the one
+        currently tracked.
+
+        Args:
+            raw (str): Raw message payload from the WebSocket.
+
+        Returns:
+            Optional[float]: Closing price of the candle that just finished,
+            or None if no candle closed on this message.
+        """
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            logger.warning("Discarding malformed WS message: %r", raw)
+            return None
+
+        # Subscription acks, heartbeats and system status arrive as dicts
+        if not isinstance(message, list) or len(message) < 4:
+            if (isinstance(message, dict)
+                    and message.get("event") == "subscriptionStatus"
+                    and message.get("status") == "error"):
+                # A rejected subscribe means no candle will ever close;
+                # stop instead of idling on a dead feed
+                logger.error("Subscription rejected for %s: %s",
+                             self.pair, message.get("errorMessage"))
+                self.stop()
+            return None
+
+        candle = message[1]
+        candle_end = float(candle[1])
+        close = float(candle[5])
+
+        if self._current_candle_end is None:
+            self._current_candle_end = candle_end
+            self._current_close = close
+            return None
+
+        if candle_end > self._current_candle_end:
+            # A new candle started, so the tracked one is final
+            closed_price = self._current_close
+            self._current_candle_end = candle_end
+            self._current_close = close
+            self.closes.append(closed_price)
+            return closed_price
+
+        self._current_close = close
+        return None
+
+    async def run(self) -> None:
+        """
+        Connect, subscribe and dispatch candle-close events until stopped.
+
+        Reconnects automatically if the connection drops, backing off
+        exponentially (capped at RECONNECT_MAX_DELAY) on repeated failures.
+        """
+        self.running = True
+        attempts = 0
+        while self.running:
+            try:
+                async with websockets.connect(self.WS_URL) as ws:
+                    await ws.send(self._subscribe_message())
+                    logger.info("Subscribed to ohlc-%s for %s", self.interval, self.pair)
+                    attempts = 0
+                    async for raw in ws:
+                        closed_price = self.handle_message(raw)
+                        if closed_price is not None and self.on_candle:
+                            self.on_candle(closed_price)
+                        if not self.running:
+                            break
+            except Exception as e:
+                if not self.running:
+                    break
+                attempts += 1
+                delay = min(self.RECONNECT_MAX_DELAY,
+                            self.RECONNECT_BASE_DELAY * 2 ** (attempts - 1))
+                logger.error("WebSocket connection error: %s; reconnecting in %.0fs", e, delay)
+                await asyncio.sleep(delay)
+
+    def stop(self) -> None:
+        """Stop the client; `run` exits after the current message."""
+        self.running = False
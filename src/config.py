@@ -0,0 +1,111 @@
+import logging
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_PATH = Path("config/trading_config.json")
+
+# Parsed configs cached per path alongside the file mtime, so repeat loads
+# only re-parse when the file actually changed
+_cache: Dict[Path, Tuple[float, "TradingConfig"]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class TradingConfig:
+    """
+    Immutable trading configuration.
+
+    Attribute access on a frozen slots dataclass is cheaper than dict lookups
+    on the hot path, and freezing rules out accidental mutation mid-run.
+    """
+    pair: str
+    timeframe: str
+    sma_length: int
+    depeg_percentage: float
+    volume: float
+    check_interval: float
+    base_currency: Optional[str] = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping) -> "TradingConfig":
+        """
+        Build a TradingConfig from a raw mapping (e.g. parsed JSON).
+
+        Args:
+            raw: Mapping with the trading parameters.
+
+        Returns:
+            TradingConfig: Validated, typed configuration.
+        """
+        return cls(
+            pair=raw['pair'],
+            timeframe=raw.get('timeframe', '1h'),
+            sma_length=int(raw['sma_length']),
+            depeg_percentage=float(raw['depeg_percentage']),
+            volume=float(raw['volume']),
+            check_interval=float(raw.get('check_interval', 3)),
+            base_currency=raw.get('base_currency')
+        )
+
+
+def load_config(path: Path = DEFAULT_CONFIG_PATH) -> TradingConfig:
+    """
+    Load trading configuration from JSON file.
+
+    The parsed config is cached and only re-read when the file's mtime
+    changes, so callers can reload freely without re-parsing. A pickled
+    snapshot is kept next to the JSON file so fresh processes (restarts,
+    crash loops) skip parsing entirely while the JSON is unchanged.
+
+    Args:
+        path: Path to the JSON configuration file.
+
+    Returns:
+        TradingConfig: The parsed configuration.
+    """
+    try:
+        mtime = path.stat().st_mtime
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        snapshot = path.with_name(f".{path.stem}.pkl")
+        config = _load_snapshot(snapshot, mtime)
+
+        if config is None:
+            config = TradingConfig.from_mapping(orjson.loads(path.read_bytes()))
+            _write_snapshot(snapshot, config)
+            logger.info("Loaded config from %s", path)
+
+        _cache[path] = (mtime, config)
+        return config
+    except Exception as e:
+        logger.error("Failed to load config: %s", e)
+        raise
+
+
+def _load_snapshot(snapshot: Path, json_mtime: float) -> Optional[TradingConfig]:
+    """Read the pickled snapshot if it is at least as new as the JSON file."""
+    try:
+        if snapshot.stat().st_mtime < json_mtime:
+            return None
+        config = pickle.loads(snapshot.read_bytes())
+        if isinstance(config, TradingConfig):
+            logger.info("Loaded config snapshot from %s", snapshot)
+            return config
+    except (OSError, pickle.PickleError, AttributeError):
+        pass  # Missing or stale snapshot; fall back to parsing the JSON
+    return None
+
+
+def _write_snapshot(snapshot: Path, config: TradingConfig) -> None:
+    """Persist the parsed config for faster loads on the next boot."""
+    try:
+        snapshot.write_bytes(pickle.dumps(config))
+    except OSError as e:
+        logger.warning("Could not write config snapshot %s: %s", snapshot, e)
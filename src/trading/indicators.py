@@ -1,5 +1,7 @@
 import logging
-from typing import Any
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -7,8 +9,12 @@ class Indicator:
     """
     Technical analysis indicator calculations.
     Currently supports SMA calculation using Kraken OHLC data.
+
+    The SMA is maintained incrementally: a rolling window of closes plus a
+    running sum is seeded from one historical fetch, then updated in O(1)
+    per candle close via `update_close` (e.g. from the WebSocket feed).
     """
-    
+
     def __init__(self, kraken_client: Any) -> None:
         """
         Initialize the indicator calculator.
@@ -17,11 +23,24 @@ class Indicator:
             kraken_client: Instance of KrakenClient for data retrieval
         """
         self.client = kraken_client
+        # Rolling state per (pair, timeframe, length)
+        self._windows: Dict[Tuple[str, int, int], Deque[float]] = {}
+        self._sums: Dict[Tuple[str, int, int], float] = {}
+        # Candle bucket of the last seed/update, to detect stale windows
+        self._window_buckets: Dict[Tuple[str, int, int], int] = {}
+
+    @staticmethod
+    def _bucket(timeframe: int) -> int:
+        """Index of the current candle for the given timeframe in minutes."""
+        return int(time.time()) // (timeframe * 60)
 
     def calculate_sma(self, pair: str, timeframe: int, length: int) -> float:
         """
         Calculate Simple Moving Average for the specified pair and parameters.
 
+        Returns the incrementally maintained value when the rolling window is
+        warm and current; otherwise fetches OHLC data once and re-seeds it.
+
         Args:
             pair: Trading pair symbol (e.g., 'XXBTZUSD')
             timeframe: Candle timeframe in minutes
@@ -34,18 +53,58 @@ class Indicator:
             Exception: If data retrieval or calculation fails
         """
         try:
-            # Get historical data
-            ohlc_data = self.client.get_historical_data(
-                pair=pair,
-                interval=timeframe
-            )
-
-            # Calculate SMA using closing prices
-            sma = ohlc_data['close'].rolling(window=length).mean().iloc[-1]
-            logger.info(f"Calculated SMA{length}: {sma}")
-            
-            return float(sma)
-            
+            key = (pair, timeframe, length)
+            bucket = self._bucket(timeframe)
+            window = self._windows.get(key)
+            if (window is not None and len(window) == length
+                    and self._window_buckets[key] == bucket):
+                return self._sums[key] / length
+
+            # Fetch raw closes (no DataFrame) and seed the rolling window.
+            # The response ends with the still-forming candle, which would
+            # later coexist with its own final close from update_close, so
+            # only closed candles are kept
+            closes = self.client.get_ohlc_closes(pair, interval=timeframe)[:-1][-length:]
+            self._windows[key] = deque(closes, maxlen=length)
+            self._sums[key] = float(sum(closes))
+            self._window_buckets[key] = bucket
+
+            sma = self._sums[key] / len(self._windows[key])
+            logger.info("Calculated SMA%s: %s", length, sma)
+            return sma
+
         except Exception as e:
-            logger.error(f"Error calculating SMA for {pair}: {str(e)}")
-            raise
\ No newline at end of file
+            logger.error("Error calculating SMA for %s: %s", pair, e)
+            raise
+
+    def update_close(self, pair: str, timeframe: int, length: int, close: float) -> Optional[float]:
+        """
+        Push one closed candle into the rolling window.
+
+        Subtracts the outgoing close and adds the incoming one, so the SMA
+        stays current without refetching or recomputing from scratch.
+
+        Args:
+            pair: Trading pair symbol (e.g., 'XXBTZUSD')
+            timeframe: Candle timeframe in minutes
+            length: Number of periods for SMA calculation
+            close: Closing price of the candle that just finished
+
+        Returns:
+            Optional[float]: Updated SMA value, or None if the window has
+            not been seeded yet (the next `calculate_sma` call seeds it).
+        """
+        key = (pair, timeframe, length)
+        window = self._windows.get(key)
+        if window is None:
+            return None
+
+        if len(window) == window.maxlen:
+            self._sums[key] -= window[0]
+        window.append(float(close))
+        self._sums[key] += float(close)
+        self._window_buckets[key] = self._bucket(timeframe)
+
+        sma = self._sums[key] / len(window)
+        logger.info("Updated SMA%s to %s on candle close %s", length, sma, close)
+        return sma
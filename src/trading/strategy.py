@@ -1,8 +1,18 @@
 import logging
-from typing import Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any
+
+from src.config import TradingConfig
 
 logger = logging.getLogger(__name__)
 
+
+def _compute_target(sma: float, depeg_factor: float) -> float:
+    """Target entry price: the SMA discounted by the depeg factor, on Kraken's 1-decimal tick."""
+    return round(sma * depeg_factor, 1)
+
+
 class LimitStrategy:
     """
     Implements a limit order strategy based on SMA deviations.
@@ -11,7 +21,7 @@ class LimitStrategy:
     
     def __init__(
         self, 
-        config: Dict[str, Any],
+        config: Any,
         kraken_client: Any,
         indicator: Any,
         test_mode: bool = True
@@ -20,12 +30,12 @@ class LimitStrategy:
         Initialize the strategy.
 
         Args:
-            config: Trading configuration parameters
+            config: Trading configuration (TradingConfig or a raw mapping)
             kraken_client: Instance of KrakenClient for API interactions
             indicator: Instance of Indicator for technical analysis
             test_mode: If True, orders are only validated not placed
         """
-        self.config = config
+        self.cfg = config if isinstance(config, TradingConfig) else TradingConfig.from_mapping(config)
         self.client = kraken_client
         self.indicator = indicator
         self.test_mode = test_mode
@@ -34,30 +44,59 @@ class LimitStrategy:
         self.active_order: Optional[str] = None
         self.entry_sma: Optional[float] = None
         self.in_position = False
+
+        # Test-mode throttle: nothing can change within one candle, so
+        # remember which candle bucket the last target was computed in and
+        # skip redundant ticks (same wall-clock scheme as Indicator._bucket)
+        self._last_target: Optional[float] = None
+        self._last_target_bucket: Optional[int] = None
+        self._candle_seconds = 3600  # strategy trades the 1h timeframe
+
+        # Loop invariants derived from config, computed once
+        self._depeg_factor = 1 - self.cfg.depeg_percentage / 100
+        self._inv_depeg_factor = 1 / self._depeg_factor
+
+        # Independent API calls within one tick run concurrently on this pool
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='strategy-io')
         
-        logger.info(f"Strategy initialized in {'test' if test_mode else 'live'} mode")
+        logger.info("Strategy initialized in %s mode", 'test' if test_mode else 'live')
+
+    def close(self) -> None:
+        """Release the strategy's worker threads."""
+        self._executor.shutdown(wait=False)
 
     def format_price(self, price: float) -> float:
         """Format price to match exchange requirements."""
         return round(price, 1)  # Kraken requires 1 decimal for XBTUSD
 
-    def check_balance_for_order(self) -> bool:
-        """Verify sufficient balance for order."""
+    def check_balance_for_order(self, target_price: float, balance_future: Any = None) -> bool:
+        """
+        Verify sufficient balance for an order at the given target price.
+
+        Args:
+            target_price: Entry price the order would be placed at.
+            balance_future: Optional in-flight balance fetch to consume
+                instead of issuing a new request.
+        """
         try:
             if self.test_mode:
                 return True
-                
-            balance = self.client.get_account_balance()
-            required = self.config['volume'] * self.calculate_target_price()
-            has_balance = float(balance.get(self.config['base_currency'], 0)) >= required
+
+            # Single-currency read; no need to materialize the full balance map
+            if balance_future is not None:
+                available = balance_future.result()
+            else:
+                available = self.client.get_currency_balance(self.cfg.base_currency)
+            required = self.cfg.volume * target_price
+            has_balance = available >= required
             
             if not has_balance:
-                logger.warning(f"Insufficient balance for order. Required: {required}")
+                logger.warning("Insufficient balance for order. Required: %s", required)
             
             return has_balance
             
         except Exception as e:
-            logger.error(f"Error checking balance: {e}")
+            logger.error("Error checking balance: %s", e)
             return False
 
     def calculate_target_price(self) -> float:
@@ -65,20 +104,19 @@ class LimitStrategy:
         try:
             # Calculate SMA
             sma = self.indicator.calculate_sma(
-                pair=self.config['pair'],
+                pair=self.cfg.pair,
                 timeframe=60,  # 1h timeframe
-                length=self.config['sma_length']
+                length=self.cfg.sma_length
             )
             
             # Calculate target price with depeg
-            target_price = sma * (1 - self.config['depeg_percentage']/100)
-            formatted_price = self.format_price(target_price)
-            
-            logger.info(f"Calculated target price: {formatted_price} (SMA: {sma})")
+            formatted_price = _compute_target(sma, self._depeg_factor)
+
+            logger.info("Calculated target price: %s (SMA: %s)", formatted_price, sma)
             return formatted_price
             
         except Exception as e:
-            logger.error(f"Error calculating target price: {e}")
+            logger.error("Error calculating target price: %s", e)
             raise
 
     def execute(self) -> None:
@@ -86,27 +124,41 @@ class LimitStrategy:
         try:
             # Entry logic - no position and no active orders
             if not self.in_position and not self.active_order:
-                if not self.check_balance_for_order():
+                candle_bucket = int(time.time()) // self._candle_seconds
+                if (self.test_mode and self._last_target is not None
+                        and candle_bucket == self._last_target_bucket):
+                    return  # Same candle in test mode: no network, no recompute
+
+                # Balance and OHLC are independent endpoints, so overlap the
+                # round trips; the target is computed exactly once and the
+                # affordability check reuses it
+                target_future = self._executor.submit(self.calculate_target_price)
+                balance_future = (None if self.test_mode else self._executor.submit(
+                    self.client.get_currency_balance, self.cfg.base_currency))
+
+                target_price = target_future.result()
+
+                if not self.check_balance_for_order(target_price, balance_future):
                     return
-                    
-                target_price = self.calculate_target_price()
-                
+
                 # Place buy order
                 order = self.client.place_limit_order(
-                    pair=self.config['pair'],
-                    volume=self.config['volume'],
+                    pair=self.cfg.pair,
+                    volume=self.cfg.volume,
                     price=target_price,
                     side='buy',
                     validate=self.test_mode
                 )
                 
                 if self.test_mode:
-                    logger.info(f"TEST MODE: Would place buy order at {target_price}")
+                    self._last_target = target_price
+                    self._last_target_bucket = candle_bucket
+                    logger.info("TEST MODE: Would place buy order at %s", target_price)
                     return
                     
                 self.active_order = order['txid'][0]
-                self.entry_sma = target_price / (1 - self.config['depeg_percentage']/100)
-                logger.info(f"Placed buy order at {target_price}")
+                self.entry_sma = target_price * self._inv_depeg_factor
+                logger.info("Placed buy order at %s", target_price)
 
             # Order management - only in live mode
             elif self.active_order and not self.test_mode:
@@ -119,14 +171,14 @@ class LimitStrategy:
                         
                         # Place sell order at entry SMA
                         sell_order = self.client.place_limit_order(
-                            pair=self.config['pair'],
-                            volume=self.config['volume'],
+                            pair=self.cfg.pair,
+                            volume=self.cfg.volume,
                             price=self.format_price(self.entry_sma),
                             side='sell',
                             validate=False
                         )
                         self.active_order = sell_order['txid'][0]
-                        logger.info(f"Buy order filled, placed sell order at {self.entry_sma}")
+                        logger.info("Buy order filled, placed sell order at %s", self.entry_sma)
                         
                     else:  # Sell order filled
                         self.in_position = False
@@ -135,19 +187,21 @@ class LimitStrategy:
                         logger.info("Position closed")
 
                 elif not self.in_position:  # Update buy order if needed
+                    # Cheap with the incremental SMA window, so no prefetch:
+                    # computing it here avoids a wasted call on filled orders
                     new_target = self.calculate_target_price()
                     current_price = float(order_details[self.active_order]['price'])
                     
                     if new_target != current_price:
                         self.client.update_limit_order(
-                            pair=self.config['pair'],
-                            volume=self.config['volume'],
+                            pair=self.cfg.pair,
+                            volume=self.cfg.volume,
                             new_price=new_target,
                             order_id=self.active_order,
                             side='buy'
                         )
                         self.active_order = None  # Will be set in next iteration
-                        logger.info(f"Updated buy order to new price {new_target}")
+                        logger.info("Updated buy order to new price %s", new_target)
 
         except Exception as e:
-            logger.error(f"Error in strategy execution: {e}")
\ No newline at end of file
+            logger.error("Error in strategy execution: %s", e)
\ No newline at end of file
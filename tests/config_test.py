@@ -0,0 +1,60 @@
+import os
+import json
+
+import pytest
+import dataclasses
+import src.config
+from src.config import TradingConfig, load_config
+
+_RAW = {
+    "pair": "XXBTZUSD",
+    "timeframe": "1h",
+    "sma_length": 25,
+    "depeg_percentage": 4,
+    "volume": 0.001,
+    "check_interval": 3
+}
+
+
+class TestTradingConfig:
+    def test_from_mapping(self):
+        config = TradingConfig.from_mapping(_RAW)
+        assert config.pair == "XXBTZUSD"
+        assert config.sma_length == 25
+        assert config.depeg_percentage == 4.0
+        assert config.base_currency is None
+
+    def test_frozen(self):
+        config = TradingConfig.from_mapping(_RAW)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.volume = 1.0
+
+    def test_load_config_caches_until_file_changes(self, tmp_path):
+        path = tmp_path / "trading_config.json"
+        path.write_text(json.dumps(_RAW))
+
+        first = load_config(path)
+        assert first is load_config(path)  # same mtime, cached object
+
+        updated = dict(_RAW, volume=0.002)
+        path.write_text(json.dumps(updated))
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 1))
+
+        reloaded = load_config(path)
+        assert reloaded.volume == 0.002
+
+    def test_load_config_prefers_fresh_snapshot(self, tmp_path):
+        path = tmp_path / "trading_config.json"
+        path.write_text(json.dumps(_RAW))
+
+        config = load_config(path)
+        snapshot = tmp_path / ".trading_config.pkl"
+        assert snapshot.exists()
+
+        # Simulate a fresh process: no in-memory cache, unreadable JSON,
+        # snapshot newer than the JSON file
+        src.config._cache.clear()
+        path.write_text("not json")
+        os.utime(path, (path.stat().st_atime, snapshot.stat().st_mtime - 1))
+
+        assert load_config(path) == config
@@ -1,4 +1,65 @@
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
+# Importing unittest.mock here warms its inspect/functools import chain once
+# per worker at collection start, instead of inside the first test module
+# that happens to need it
+import unittest.mock  # noqa: F401
+from unittest.mock import Mock, MagicMock, patch, call  # noqa: F401
+
+from src.api.kraken_client import KrakenClient
+
+# Built once and shared; a tuple so no test can mutate it for its neighbours
+_FAKE_OHLC = {"close": (100.0,) * 26}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quiet_logs():
+    """Silence strategy logging once per session instead of patching the
+    logger in every test that triggers it."""
+    import logging
+    logging.getLogger("src.trading.strategy").setLevel(logging.CRITICAL + 1)
+
+@pytest.fixture(scope="session", autouse=True)
+def _env():
+    """Load .env once per test session instead of per module import."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# Read-only so no test can contaminate the shared config for its neighbours;
+# TradingConfig.from_mapping accepts any mapping
+_CONFIG = MappingProxyType({
+    "pair": "XXBTZUSD",
+    "timeframe": "1h",
+    "sma_length": 25,
+    "depeg_percentage": 4,
+    "volume": 0.001,
+    "base_currency": "ZUSD",
+    "check_interval": 3
+})
+
+@pytest.fixture(scope="session")
+def mock_config():
+    return _CONFIG
+
+@pytest.fixture(scope="session")
+def mock_kraken_client():
+    client = Mock(spec=KrakenClient)
+    client.get_currency_balance.return_value = 1000.0
+    client.get_historical_data.return_value = _FAKE_OHLC
+    client.get_ticker_info.return_value = {"XXBTZUSD": {"c": ["30000.0"]}}
+    return client
+
+@pytest.fixture(scope="session")
+def mock_indicator():
+    # No test asserts on calculate_sma calls, so a plain namespace with a
+    # function beats Mock's per-call bookkeeping
+    return SimpleNamespace(calculate_sma=lambda *args, **kwargs: 100.0)
+
+@pytest.fixture(autouse=True)
+def _reset_shared_state(mock_kraken_client):
+    """Give every test clean call counts on the shared mock client."""
+    mock_kraken_client.reset_mock()
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "integration: mark test as an integration test")
@@ -1,21 +1,11 @@
-import sys
-import os
-from dotenv import load_dotenv
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 import pytest
 from unittest.mock import patch, Mock
-import pandas as pd
 from src.trading.indicators import Indicator
 
 @pytest.fixture
 def mock_kraken_client():
     client = Mock()
-    df = pd.DataFrame({
-        'close': [100.0] * 30  
-    })
-    client.get_historical_data.return_value = df
+    client.get_ohlc_closes.return_value = [100.0] * 30
     return client
 
 class TestIndicator:
@@ -25,7 +15,39 @@ class TestIndicator:
         
         assert isinstance(sma, float)
         assert sma == 100.0 
-        mock_kraken_client.get_historical_data.assert_called_once_with(
-            pair="XXBTZUSD",
+        mock_kraken_client.get_ohlc_closes.assert_called_once_with(
+            "XXBTZUSD",
             interval=60
-        )
\ No newline at end of file
+        )
+
+    def test_calculate_sma_excludes_forming_candle(self, mock_kraken_client):
+        # The newest close is a mid-candle snapshot and must not be seeded
+        mock_kraken_client.get_ohlc_closes.return_value = [100.0] * 29 + [999.0]
+        indicator = Indicator(mock_kraken_client)
+
+        assert indicator.calculate_sma("XXBTZUSD", 60, 25) == 100.0
+
+    def test_calculate_sma_cached_within_candle(self, mock_kraken_client):
+        indicator = Indicator(mock_kraken_client)
+        first = indicator.calculate_sma("XXBTZUSD", 60, 25)
+        second = indicator.calculate_sma("XXBTZUSD", 60, 25)
+
+        assert first == second == 100.0
+        # Second call inside the same candle must not re-fetch
+        mock_kraken_client.get_ohlc_closes.assert_called_once()
+
+    def test_update_close_rolls_the_window(self, mock_kraken_client):
+        indicator = Indicator(mock_kraken_client)
+        indicator.calculate_sma("XXBTZUSD", 60, 25)
+
+        # 100 leaves the window, 125 enters: SMA moves by 25/25
+        sma = indicator.update_close("XXBTZUSD", 60, 25, 125.0)
+
+        assert sma == 101.0
+        assert indicator.calculate_sma("XXBTZUSD", 60, 25) == 101.0
+        mock_kraken_client.get_ohlc_closes.assert_called_once()
+
+    def test_update_close_without_seed(self, mock_kraken_client):
+        indicator = Indicator(mock_kraken_client)
+        assert indicator.update_close("XXBTZUSD", 60, 25, 125.0) is None
+        mock_kraken_client.get_ohlc_closes.assert_not_called()
\ No newline at end of file
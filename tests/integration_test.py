@@ -1,15 +1,9 @@
-import sys
 import os
-from dotenv import load_dotenv
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import pytest
 import pandas as pd
 from src.api.kraken_client import KrakenClient
 
-load_dotenv()
-
 @pytest.mark.integration
 class TestKrakenIntegration:
     @pytest.fixture
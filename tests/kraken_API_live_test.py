@@ -1,10 +1,5 @@
-import sys
-import os
-from dotenv import load_dotenv
 import time
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 import pytest
 import pandas as pd
 import logging
@@ -15,8 +10,6 @@ from src.api.kraken_client import KrakenClient
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-
 def handle_rate_limit():
     """Handle rate limiting by sleeping"""
     time.sleep(5)
@@ -44,9 +37,6 @@ class TestKrakenLiveAPI:
             data = live_client.get_historical_data("EURTUSDT", interval=60)
             logger.info(f"Received data shape: {data.shape}")
             
-            # Convert string prices to float
-            data['close'] = pd.to_numeric(data['close'], errors='coerce')
-            
             # Print first few rows for debugging
             logger.info(f"First few rows of data:\n{data.head()}")
             
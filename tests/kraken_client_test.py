@@ -1,113 +1,162 @@
-import sys
-import os
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 import pytest
-from unittest.mock import patch
-from src.api.kraken_client import KrakenClient
+import pandas as pd
+from unittest.mock import MagicMock, call
+from src.api.kraken_client import API, KrakenAPI, KrakenClient
+
+def called_once_with(mock, *args, **kwargs):
+    """Cheap equivalent of assert_called_once_with: plain attribute reads,
+    no unconditional error-message formatting."""
+    assert mock.call_count == 1 and mock.call_args == call(*args, **kwargs)
+
+# (client method, mock attribute, return value, call args, call kwargs) for
+# every "set return -> call -> assert equal -> assert called once" test
+CASES = [
+    ("get_account_balance", "get_account_balance", {"USD": 1000.0}, (), {}),
+    ("get_ticker_info", "get_ticker_information", {"XBTUSD": {"a": ["50000.0"]}}, ("XBTUSD",), {}),
+    ("get_open_orders", "get_open_orders", {"open": {"order123": {"status": "open"}}}, (), {}),
+    ("get_trade_history", "get_trades_history", {"trades": {"trade123": {"pair": "XBTUSD"}}}, (), {}),
+    ("get_order_details", "query_orders_info", {"order123": {"status": "closed"}}, (), {"txid": "order123"}),
+]
+
+# KrakenAPI methods the client calls through self.kraken
+_KRAKEN_API_METHODS = (
+    'get_server_time',
+    'get_account_balance',
+    'get_ticker_information',
+    'get_ohlc_data',
+    'add_standard_order',
+    'get_open_orders',
+    'get_trades_history',
+    'query_orders_info',
+)
 
 @pytest.fixture
-def kraken_client():
-    return KrakenClient()
-
-@patch('src.api.kraken_client.KrakenAPI.get_server_time')
-@patch('src.api.kraken_client.KrakenClient.get_account_balance')
-def test_test_connection(mock_get_account_balance, mock_get_server_time, kraken_client):
-    mock_get_server_time.return_value = {"unixtime": 1629828000}
-    mock_get_account_balance.return_value = {"USD": 1000.0}
-    
-    result = kraken_client.test_connection()
-    
-    assert result is True
-    mock_get_server_time.assert_called_once()
-    mock_get_account_balance.assert_called_once()
-
-@patch('src.api.kraken_client.KrakenAPI.get_account_balance')
-def test_get_account_balance(mock_get_account_balance, kraken_client):
-    mock_get_account_balance.return_value = {"USD": 1000.0}
-    
-    balance = kraken_client.get_account_balance()
-    
-    assert balance == {"USD": 1000.0}
-    mock_get_account_balance.assert_called_once()
-
-@patch('src.api.kraken_client.KrakenAPI.get_ticker_information')
-def test_get_ticker_info(mock_get_ticker_information, kraken_client):
-    mock_get_ticker_information.return_value = {"XBTUSD": {"a": ["50000.0"]}}
-    
-    ticker_info = kraken_client.get_ticker_info("XBTUSD")
-    
-    assert ticker_info == {"XBTUSD": {"a": ["50000.0"]}}
-    mock_get_ticker_information.assert_called_once_with("XBTUSD")
-
-@patch('src.api.kraken_client.KrakenAPI.get_ohlc_data')
-def test_get_historical_data(mock_get_ohlc_data, kraken_client):
-    mock_get_ohlc_data.return_value = ({"time": [1629828000]}, 12345)
-    
-    ohlc_data = kraken_client.get_historical_data("XBTUSD", interval=60)
-    
-    assert "time" in ohlc_data
-    mock_get_ohlc_data.assert_called_once_with("XBTUSD", interval=60, since=None)
-
-@patch('src.api.kraken_client.KrakenAPI.add_standard_order')
-def test_place_limit_order(mock_add_standard_order, kraken_client):
-    mock_add_standard_order.return_value = {"descr": {"order": "buy 0.01 XBTUSD @ limit 30000"}}
-    
-    order = kraken_client.place_limit_order(pair="XBTUSD", volume=0.01, price=30000, side="buy", validate=True)
-    
-    assert "descr" in order
-    mock_add_standard_order.assert_called_once_with(pair="XBTUSD", type="buy", ordertype="limit", volume=0.01, price=30000, validate=True)
-
-@patch('src.api.kraken_client.API.query_private')
-@patch('src.api.kraken_client.KrakenClient.place_limit_order')
-def test_update_limit_order(mock_place_limit_order, mock_query_private, kraken_client):
-    # Mocking the cancellation response as successful
-    mock_query_private.return_value = {"error": [], "result": {"count": 1}}
-    
-    # Mocking the placement of a new limit order
-    mock_place_limit_order.return_value = {"descr": {"order": "buy 0.01 XBTUSD @ limit 31000"}}
-    
-    # Call the update_limit_order method
-    kraken_client.update_limit_order(pair="XBTUSD", volume=0.01, new_price=31000, order_id="order123", side="buy")
-
-    # Asserting that cancel_order (via query_private) and place_limit_order were called
-    mock_query_private.assert_called_once_with('CancelOrder', {'txid': 'order123'})
-    mock_place_limit_order.assert_called_once_with(pair="XBTUSD", volume=0.01, price=31000, side="buy", validate=False)
-
-
-@patch('src.api.kraken_client.API.query_private')
-def test_cancel_order(mock_query_private, kraken_client):
-    mock_query_private.return_value = {"error": [], "result": {"count": 1}}
-    
-    kraken_client.cancel_order(order_id="order123")
-    
-    mock_query_private.assert_called_once_with('CancelOrder', {'txid': 'order123'})
-
-@patch('src.api.kraken_client.KrakenAPI.get_open_orders')
-def test_get_open_orders(mock_get_open_orders, kraken_client):
-    mock_get_open_orders.return_value = {"open": {"order123": {"status": "open"}}}
-    
-    open_orders = kraken_client.get_open_orders()
-    
-    assert "open" in open_orders
-    mock_get_open_orders.assert_called_once()
-
-@patch('src.api.kraken_client.KrakenAPI.get_trades_history')
-def test_get_trade_history(mock_get_trades_history, kraken_client):
-    mock_get_trades_history.return_value = {"trades": {"trade123": {"pair": "XBTUSD"}}}
-    
-    trade_history = kraken_client.get_trade_history()
-    
-    assert "trades" in trade_history
-    mock_get_trades_history.assert_called_once()
-
-@patch('src.api.kraken_client.KrakenAPI.query_orders_info')
-def test_get_order_details(mock_query_orders_info, kraken_client):
-    mock_query_orders_info.return_value = {"order123": {"status": "closed"}}
-    
-    order_details = kraken_client.get_order_details(txid="order123")
-    
-    assert "order123" in order_details
-    mock_query_orders_info.assert_called_once_with(txid="order123")
+def kraken_mocks(monkeypatch):
+    """
+    Patch every wrapped API method in one pass and hand back the namespace.
+
+    Tests set return values and assert calls on attributes of the returned
+    mock (e.g. kraken_mocks.get_server_time) instead of stacking @patch
+    decorators per test.
+    """
+    mocks = MagicMock()
+    for name in _KRAKEN_API_METHODS:
+        monkeypatch.setattr(KrakenAPI, name, getattr(mocks, name))
+    monkeypatch.setattr(API, 'query_public', mocks.query_public)
+    monkeypatch.setattr(API, 'query_private', mocks.query_private)
+    return mocks
+
+
+@pytest.fixture(scope="class")
+def _client(request):
+    """One KrakenClient for the whole class: session setup and pool
+    construction happen once, tests reach it as self.client."""
+    request.cls.client = KrakenClient()
+
+
+@pytest.mark.usefixtures("_client")
+class TestKrakenClient:
+    @pytest.fixture(autouse=True)
+    def _fresh_caches(self):
+        self.client._ticker_cache.clear()
+        self.client._ohlc_cache.clear()
+
+    def test_shared_session(self):
+        # All requests should reuse one pooled keep-alive session
+        assert self.client.api.session is self.client._session
+        assert self.client._session.headers.get('Connection') == 'keep-alive'
+
+    def test_test_connection(self, kraken_mocks):
+        kraken_mocks.get_server_time.return_value = {"unixtime": 1629828000}
+        kraken_mocks.get_account_balance.return_value = {"USD": 1000.0}
+
+        result = self.client.test_connection()
+
+        assert result is True
+        kraken_mocks.get_server_time.assert_called_once()
+        kraken_mocks.get_account_balance.assert_called_once()
+
+    @pytest.mark.parametrize("method_name, mock_name, ret, args, kwargs", CASES)
+    def test_passthrough_methods(self, kraken_mocks, method_name, mock_name, ret, args, kwargs):
+        mock = getattr(kraken_mocks, mock_name)
+        mock.return_value = ret
+
+        result = getattr(self.client, method_name)(*args, **kwargs)
+
+        assert result == ret
+        called_once_with(mock, *args, **kwargs)
+
+    def test_get_currency_balance(self, kraken_mocks):
+        kraken_mocks.get_account_balance.return_value = pd.DataFrame({"vol": [1000.0]}, index=["ZUSD"])
+
+        assert self.client.get_currency_balance("ZUSD") == 1000.0
+        assert self.client.get_currency_balance("XXBT") == 0.0
+
+    def test_get_historical_data(self, kraken_mocks):
+        kraken_mocks.get_ohlc_data.return_value = ({"time": [1629828000]}, 12345)
+
+        ohlc_data = self.client.get_historical_data("XBTUSD", interval=60)
+
+        assert "time" in ohlc_data
+        called_once_with(kraken_mocks.get_ohlc_data, "XBTUSD", interval=60, since=None)
+
+    def test_get_ohlc_closes(self, kraken_mocks):
+        candle = [1629828000, "30000.0", "30100.0", "29900.0", "30050.0", "30000.0", "1.5", 10]
+        kraken_mocks.query_public.return_value = {"error": [], "result": {"XBTUSD": [candle], "last": 1629828000}}
+
+        closes = self.client.get_ohlc_closes("XBTUSD", interval=60)
+
+        assert closes == [30050.0]
+        called_once_with(kraken_mocks.query_public, 'OHLC', {'pair': 'XBTUSD', 'interval': 60})
+
+    def test_get_ohlc_closes_api_error(self, kraken_mocks):
+        kraken_mocks.query_public.return_value = {"error": ["EQuery:Unknown asset pair"], "result": {}}
+
+        with pytest.raises(ValueError):
+            self.client.get_ohlc_closes("BADPAIR")
+
+    def test_get_ticker_info_cached_within_ttl(self, kraken_mocks):
+        kraken_mocks.get_ticker_information.return_value = {"XBTUSD": {"a": ["50000.0"]}}
+
+        first = self.client.get_ticker_info("XBTUSD")
+        second = self.client.get_ticker_info("XBTUSD")
+
+        assert first is second
+        called_once_with(kraken_mocks.get_ticker_information, "XBTUSD")
+
+    def test_get_historical_data_cached_within_candle(self, kraken_mocks):
+        kraken_mocks.get_ohlc_data.return_value = ({"time": [1629828000]}, 12345)
+
+        first = self.client.get_historical_data("XBTUSD", interval=60)
+        second = self.client.get_historical_data("XBTUSD", interval=60)
+
+        assert first is second
+        kraken_mocks.get_ohlc_data.assert_called_once()
+
+    def test_place_limit_order(self, kraken_mocks):
+        kraken_mocks.add_standard_order.return_value = {"descr": {"order": "buy 0.01 XBTUSD @ limit 30000"}}
+
+        order = self.client.place_limit_order(pair="XBTUSD", volume=0.01, price=30000, side="buy", validate=True)
+
+        assert "descr" in order
+        called_once_with(kraken_mocks.add_standard_order, pair="XBTUSD", type="buy", ordertype="limit", volume=0.01, price=30000, validate=True)
+
+    def test_update_limit_order(self, kraken_mocks):
+        kraken_mocks.query_private.return_value = {"error": [], "result": {"count": 1}}
+        kraken_mocks.add_standard_order.return_value = {"descr": {"order": "buy 0.01 XBTUSD @ limit 31000"}}
+
+        self.client.update_limit_order(pair="XBTUSD", volume=0.01, new_price=31000, order_id="order123", side="buy")
+
+        # One comparison on the shared namespace checks both call shapes and
+        # that the cancel went out before the replacement order
+        assert kraken_mocks.mock_calls == [
+            call.query_private('CancelOrder', {'txid': 'order123'}),
+            call.add_standard_order(pair="XBTUSD", type="buy", ordertype="limit", volume=0.01, price=31000, validate=False),
+        ]
+
+    def test_cancel_order(self, kraken_mocks):
+        kraken_mocks.query_private.return_value = {"error": [], "result": {"count": 1}}
+
+        self.client.cancel_order(order_id="order123")
 
+        called_once_with(kraken_mocks.query_private, 'CancelOrder', {'txid': 'order123'})
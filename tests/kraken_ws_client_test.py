@@ -0,0 +1,113 @@
+import json
+
+import pytest
+from src.api import kraken_ws_client
+from src.api.kraken_ws_client import KrakenWSClient
+
+
+def _ohlc_message(end_time: float, close: float) -> str:
+    candle = ["1680000000.0", str(end_time), "100.0", "101.0", "99.0", str(close), "100.5", "1.2", 42]
+    return json.dumps([42, candle, "ohlc-60", "XBT/USD"])
+
+
+class _FakeConnection:
+    """Stands in for websockets.connect: replays canned messages, records sends."""
+
+    def __init__(self, messages):
+        self._messages = list(messages)
+        self.sent = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._messages:
+            raise StopAsyncIteration
+        return self._messages.pop(0)
+
+
+@pytest.fixture
+def ws_client():
+    return KrakenWSClient(pair="XBT/USD", interval=60, window_length=3)
+
+
+class TestKrakenWSClient:
+    def test_subscribe_message(self, ws_client):
+        message = json.loads(ws_client._subscribe_message())
+        assert message["event"] == "subscribe"
+        assert message["pair"] == ["XBT/USD"]
+        assert message["subscription"] == {"name": "ohlc", "interval": 60}
+
+    def test_ignores_non_ohlc_messages(self, ws_client):
+        assert ws_client.handle_message('{"event": "heartbeat"}') is None
+        assert ws_client.handle_message('not json') is None
+        assert ws_client.closes == ws_client.closes.__class__(maxlen=3)
+
+    def test_candle_close_detection(self, ws_client):
+        # Updates within the same candle do not close it
+        assert ws_client.handle_message(_ohlc_message(1680003600, 100.0)) is None
+        assert ws_client.handle_message(_ohlc_message(1680003600, 102.0)) is None
+        assert len(ws_client.closes) == 0
+
+        # A later end-time finalizes the tracked candle at its last close
+        closed = ws_client.handle_message(_ohlc_message(1680007200, 103.0))
+        assert closed == 102.0
+        assert list(ws_client.closes) == [102.0]
+
+    def test_on_candle_window_is_rolling(self, ws_client):
+        ws_client.seed([100.0, 101.0, 102.0])
+        ws_client.handle_message(_ohlc_message(1680003600, 103.0))
+        ws_client.handle_message(_ohlc_message(1680007200, 104.0))
+        assert list(ws_client.closes) == [101.0, 102.0, 103.0]
+
+    def test_rest_pair_maps_to_wsname(self):
+        client = KrakenWSClient(pair="XXBTZUSD", interval=60)
+        assert client.pair == "XBT/USD"
+        assert json.loads(client._subscribe_message())["pair"] == ["XBT/USD"]
+        assert KrakenWSClient.to_ws_pair("XLTCZUSD") == "LTC/USD"
+        assert KrakenWSClient.to_ws_pair("XBT/USD") == "XBT/USD"
+
+    def test_subscription_error_stops_client(self, ws_client):
+        ws_client.running = True
+        rejection = json.dumps({
+            "event": "subscriptionStatus",
+            "status": "error",
+            "errorMessage": "Currency pair not supported XXBTZUSD",
+        })
+        assert ws_client.handle_message(rejection) is None
+        assert ws_client.running is False
+
+    def test_sma(self, ws_client):
+        assert ws_client.sma is None
+        ws_client.seed([100.0, 102.0])
+        assert ws_client.sma == 101.0
+
+    async def test_run_subscribes_and_dispatches_closes(self, ws_client, monkeypatch):
+        received = []
+
+        def on_candle(price):
+            received.append(price)
+            ws_client.stop()
+
+        ws_client.on_candle = on_candle
+        connection = _FakeConnection([
+            _ohlc_message(1680003600, 100.0),
+            _ohlc_message(1680003600, 102.0),
+            _ohlc_message(1680007200, 103.0),
+        ])
+        monkeypatch.setattr(kraken_ws_client.websockets, 'connect', lambda url: connection)
+
+        await ws_client.run()
+
+        assert connection.sent == [ws_client._subscribe_message()]
+        assert received == [102.0]
+        assert ws_client.running is False